@@ -4,27 +4,37 @@ app.py
 
 FastAPI server that:
  - reads LINKEDIN_EMAIL and LINKEDIN_PASSWORD from .env / environment
- - provides POST /search to run a LinkedIn search and extract profiles that have resumes attached
- - collects profiles from search results using a primary Selenium driver
- - checks profiles in parallel using ThreadPoolExecutor (each worker creates & logs in its own driver)
+ - caches the logged-in session cookies in OUTPUT_DIR/.session.json and skips login while they stay valid
+ - provides POST /search to start a LinkedIn search job (runs in the background) that extracts profiles
+   that have resumes attached, and GET /search/{job_id} to poll its status and results
+ - collects profiles via LinkedIn's Voyager search API (falls back to scrolling results with the primary Selenium driver)
+ - checks profiles concurrently over async HTTP (httpx + asyncio) reusing the login session cookies
  - saves results to CSV in /app/output and logs to /app/logs/app.log (rotating)
 """
 
 import os
+import csv
 import time
 import json
 import re
+import html
 import random
+import uuid
+import queue
+import atexit
+import asyncio
 import logging
+import functools
 from logging.handlers import RotatingFileHandler
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from urllib.parse import urljoin, urlsplit
 
+import httpx
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-import pandas as pd
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -35,14 +45,23 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    # google-re2: linear-time DFA matching for the page-HTML scans; stdlib re is a drop-in fallback
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
 # Load environment
 load_dotenv()
 LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL")
 LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
 HEADLESS = os.getenv("HEADLESS", "true").lower() in ("1", "true", "yes")
 CHROME_BIN = os.getenv("CHROME_BIN", "/usr/bin/chromium")
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH", "/usr/bin/chromedriver")
 OUTPUT_DIR = os.getenv("OUTPUT_DIR", "/app/output")
 LOG_DIR = os.getenv("LOG_DIR", "/app/logs")
+SESSION_PATH = os.path.join(OUTPUT_DIR, ".session.json")
+IDLE_DRIVERS_MAX = 2  # logged-in browsers kept alive between requests
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(LOG_DIR, exist_ok=True)
 
@@ -68,9 +87,55 @@ logger.info("Starting LinkedIn scraper service")
 SEARCH_XPATH = "/html/body/div[5]/header/div/div/div/div[1]/input"
 SEARCH_QUERY_DEFAULT = "Software Engineer"
 MAX_PROFILES_DEFAULT = 20
-MAX_WORKERS = 6  # number of parallel profile-checking threads
+PROFILE_CONCURRENCY = 64  # concurrent HTTP profile fetches (I/O bound; bounded by LinkedIn rate limits)
 SEARCH_RESULTS_UL_CSS = "ul[role='list']"
-RESUME_REGEX = re.compile(r"\.pdf|\.docx|\.doc|resume|cv", re.IGNORECASE)
+SEARCH_RESULT_LINK_CSS = "a.yRgCVsjrzAHkdCEjqvAcmnsmCUhbwIZbY"
+# Collects the profile link of every result item (preferring SEARCH_RESULT_LINK_CSS, else the first anchor),
+# then scrolls one viewport. Returns [hrefs, item_count, scroll_height_before_scroll].
+COLLECT_AND_SCROLL_JS = """
+const items = document.querySelectorAll(arguments[0] + " > li");
+const hrefs = [];
+for (const li of items) {
+    const a = li.querySelector(arguments[1]) || li.querySelector("a");
+    if (a && a.href) hrefs.push(a.href);
+}
+const height = document.body.scrollHeight;
+window.scrollBy(0, window.innerHeight);
+return [hrefs, items.length, height];
+"""
+MAX_SCROLL_TRIES = 3  # consecutive scrolls that load nothing before giving up (2+4+4 = 10s budget)
+SCROLL_WAIT_MIN = 2  # seconds to wait for new results after a scroll
+SCROLL_WAIT_MAX = 4  # backoff cap for the scroll wait
+VOYAGER_SEARCH_URL = "https://www.linkedin.com/voyager/api/search/blended"
+VOYAGER_PAGE_SIZE = 49  # max results per Voyager search request
+# Resources the browser never needs for login/search (CSS is kept: the fallback scroll relies on layout)
+BLOCKED_URL_PATTERNS = ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm"]
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0 Safari/537.36"
+# Chrome command-line flags shared by every driver (--headless=new is added per call)
+CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1400,1000",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-infobars",
+    "--disable-extensions",
+    f"user-agent={USER_AGENT}",
+)
+CHROME_PREFS = {
+    # don't download images at all
+    "profile.managed_default_content_settings.images": 2,
+}
+# page-level pre-check: plain substring tests on the lowercased HTML (".doc" also covers ".docx")
+RESUME_KEYWORDS = (".pdf", ".doc", "resume", "cv")
+# <a> hrefs pointing at documents or containing 'resume'/'cv', matched in a single pass over the page HTML
+# (only anchor tags: <link>/preload/stylesheet hrefs are asset URLs, not resume links)
+# (inline (?i) instead of re.IGNORECASE so the pattern compiles under both re2 and re)
+ANCHOR_REGEX = regex_engine.compile(r'(?i)<a(?:\s[^>]*?)?\shref="([^"]*(?:\.pdf|\.docx?|resume|cv)[^"]*)"')
+# first path segments of pages that mean a profile can't be read: login (incl. /uas/login), authwall, 404
+UNREACHABLE_SEGMENTS = ("login", "uas", "authwall", "checkpoint", "404")
+MAX_PROFILE_BYTES = 10 * 1024 * 1024  # stop downloading (decompressed) profile pages past this size
+CSV_FIELDS = ["profile_url", "resume_found", "resume_links", "error"]
 
 
 # Request body model
@@ -81,6 +146,31 @@ class SearchRequest(BaseModel):
 
 app = FastAPI(title="LinkedIn Scraper API")
 
+# In-memory job registry: job_id -> status/summary dict (lives as long as the server process)
+JOBS: Dict[str, Dict[str, Any]] = {}
+
+
+def prepare_driver(driver) -> None:
+    """Apply CDP tweaks to a fresh driver: hide navigator.webdriver and block heavy resources."""
+    try:
+        # anti-detection tweak
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        })
+    except Exception:
+        pass
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.warning("Could not enable resource blocking: %s", e)
+
+
+@functools.lru_cache(maxsize=1)
+def webdriver_manager_path() -> str:
+    """Resolve (and download if needed) a chromedriver via webdriver-manager, once per process."""
+    return ChromeDriverManager().install()
+
 
 def create_driver(headless: bool = True):
     """Create and configure a Chrome WebDriver instance.
@@ -93,42 +183,27 @@ def create_driver(headless: bool = True):
     if os.path.exists(CHROME_BIN):
         options.binary_location = CHROME_BIN
 
+    # driver.get() returns on DOMContentLoaded instead of waiting for late trackers/iframes (window.onload)
+    options.page_load_strategy = "eager"
     if headless:
         options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1400,1000")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--disable-infobars")
-    options.add_argument("--disable-extensions")
-    options.add_argument("user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0 Safari/537.36")
+    for arg in CHROME_ARGS:
+        options.add_argument(arg)
+    options.add_experimental_option("prefs", dict(CHROME_PREFS))
 
     # Preferred: use system-installed chromedriver if available
-    chromedriver_env = os.getenv("CHROMEDRIVER_PATH", "/usr/bin/chromedriver")
-    if os.path.exists(chromedriver_env):
-        service = ChromeService(executable_path=chromedriver_env)
+    if os.path.exists(CHROMEDRIVER_PATH):
+        service = ChromeService(executable_path=CHROMEDRIVER_PATH)
         driver = webdriver.Chrome(service=service, options=options)
-        try:
-            # anti-detection tweak
-            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-            })
-        except Exception:
-            pass
+        prepare_driver(driver)
         return driver
 
     # Fallback: use webdriver-manager to download a driver that matches installed/chosen browser
     # We limit webdriver-manager's probing to reduce noise. It will still try to detect local browsers.
     try:
-        service = ChromeService(ChromeDriverManager().install())
+        service = ChromeService(webdriver_manager_path())
         driver = webdriver.Chrome(service=service, options=options)
-        try:
-            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-            })
-        except Exception:
-            pass
+        prepare_driver(driver)
         return driver
     except Exception as e:
         # give a clear error with guidance
@@ -165,11 +240,236 @@ def login_linkedin(driver, timeout=20):
         except TimeoutException:
             raise RuntimeError("Login didn't complete — possible 2FA or blocking.")
 
-    # brief sleep for JS
-    time.sleep(1.5)
+    # instead of a fixed sleep for JS, wait (bounded) until the search box accepts input;
+    # the page keeps loading, since the fallback search types into it next
+    try:
+        WebDriverWait(driver, 5).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[placeholder='Search']")))
+    except TimeoutException:
+        pass
     return True
 
 
+def save_session(cookies: List[Dict[str, Any]]) -> None:
+    """Persist Selenium session cookies (li_at, JSESSIONID, ...) so later runs can skip the login form."""
+    try:
+        fd = os.open(SESSION_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump(cookies, f)
+    except OSError as e:
+        logger.warning("Could not save session to %s: %s", SESSION_PATH, e)
+
+
+def load_session() -> List[Dict[str, Any]]:
+    """Load cookies saved by save_session; returns [] if there is no usable session file."""
+    try:
+        with open(SESSION_PATH, encoding="utf-8") as f:
+            cookies = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return cookies if isinstance(cookies, list) else []
+
+
+def session_cookies(cookies: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Flatten Selenium cookie dicts into a name -> value mapping for HTTP clients."""
+    return {c["name"]: c["value"] for c in cookies}
+
+
+def session_is_valid(cookies: List[Dict[str, Any]], timeout=10) -> bool:
+    """Probe the feed with the given cookies: 200 means logged in, a redirect means the session expired."""
+    jar = session_cookies(cookies)
+    if "li_at" not in jar:
+        return False
+    try:
+        response = httpx.head(
+            "https://www.linkedin.com/feed/",
+            cookies=jar,
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=False,
+            timeout=timeout,
+        )
+    except httpx.HTTPError as e:
+        logger.warning("Session validity probe failed: %s", e)
+        return False
+    return response.status_code == 200
+
+
+def is_unreachable_path(path: str) -> bool:
+    """True if a LinkedIn URL path is a login/authwall/checkpoint/404 page or the /in/unavailable stub.
+
+    Compares whole path segments, so profiles like /in/loginov-ivan are not matched.
+    """
+    segments = [segment for segment in path.split("/") if segment]
+    if not segments:
+        return False
+    return segments[0] in UNREACHABLE_SEGMENTS or segments == ["in", "unavailable"]
+
+
+def on_login_page(driver) -> bool:
+    """True if LinkedIn redirected the driver to the login page / authwall (no valid session)."""
+    return is_unreachable_path(urlsplit(driver.current_url or "").path)
+
+
+def restore_session(driver, cookies: List[Dict[str, Any]]) -> bool:
+    """Load saved cookies into driver and open the feed. Returns False if LinkedIn still wants a login."""
+    driver.get("https://www.linkedin.com")
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+        except WebDriverException:
+            continue
+    driver.get("https://www.linkedin.com/feed/")
+    return not on_login_page(driver)
+
+
+def create_logged_in_driver(headless=True, cookies: Optional[List[Dict[str, Any]]] = None):
+    """Create a driver with a LinkedIn session.
+
+    Restores `cookies` when given; otherwise (or if they are rejected) logs in and saves the new session.
+    """
+    driver = create_driver(headless=headless)
+    try:
+        if cookies and restore_session(driver, cookies):
+            return driver
+        login_linkedin(driver)
+        save_session(driver.get_cookies())
+    except Exception:
+        driver.quit()
+        raise
+    return driver
+
+
+# Logged-in browsers left over from earlier requests. A shared queue rather than threading.local:
+# the threadpool threads that run collect_profiles come and go, a driver must outlive them.
+_idle_drivers: "queue.Queue" = queue.Queue()
+
+
+def acquire_driver(headless=True, cookies: Optional[List[Dict[str, Any]]] = None):
+    """Borrow an idle logged-in driver from an earlier request, or create one.
+
+    A borrowed driver is moved back to the feed and logged in again if its session expired;
+    dead browsers are discarded. Return drivers with release_driver.
+    """
+    while True:
+        try:
+            driver = _idle_drivers.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            driver.get("https://www.linkedin.com/feed/")
+            if on_login_page(driver):
+                logger.info("Cached driver session expired; logging in again")
+                login_linkedin(driver)
+                save_session(driver.get_cookies())
+            logger.info("Reusing cached logged-in driver")
+            return driver
+        except Exception as e:
+            logger.warning("Discarding cached driver: %s", e)
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    return create_logged_in_driver(headless=headless, cookies=cookies)
+
+
+def release_driver(driver) -> None:
+    """Keep driver for the next request, or quit it if IDLE_DRIVERS_MAX are already cached."""
+    if _idle_drivers.qsize() < IDLE_DRIVERS_MAX:
+        _idle_drivers.put(driver)
+        return
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+@atexit.register
+def close_idle_drivers() -> None:
+    """Quit every cached driver on interpreter shutdown."""
+    while True:
+        try:
+            driver = _idle_drivers.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+def canonical_profile_url(url: str) -> str:
+    """Strip query string, fragment and trailing slash so tracking variants of one profile dedupe."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path.rstrip('/')}"
+
+
+def search_profiles_api(cookies: Dict[str, str], query: str, max_profiles: int = MAX_PROFILES_DEFAULT, timeout=15) -> List[Dict[str, Any]]:
+    """Collect profile URLs from LinkedIn's internal Voyager search API (one JSON request per page).
+
+    Returns an empty list when the API is unavailable so the caller can fall back to
+    search_and_collect_profiles.
+    """
+    csrf_token = cookies.get("JSESSIONID", "").strip('"')
+    if not csrf_token:
+        logger.warning("No JSESSIONID cookie in session; cannot use Voyager search API.")
+        return []
+
+    headers = {
+        "User-Agent": USER_AGENT,
+        "Accept": "application/json",
+        "csrf-token": csrf_token,
+        "x-li-lang": "en_US",
+        "x-restli-protocol-version": "2.0.0",
+    }
+    profiles = []
+    seen = set()
+    start = 0
+    try:
+        with httpx.Client(cookies=cookies, headers=headers, http2=True, timeout=timeout) as client:
+            while len(profiles) < max_profiles:
+                response = client.get(VOYAGER_SEARCH_URL, params={
+                    "count": VOYAGER_PAGE_SIZE,
+                    "keywords": query,
+                    "filters": "List(resultType->PEOPLE)",
+                    "origin": "GLOBAL_SEARCH_HEADER",
+                    "q": "all",
+                    "start": start,
+                })
+                response.raise_for_status()
+                added = 0
+                for cluster in response.json().get("elements", []):
+                    for item in cluster.get("elements", []):
+                        href = item.get("navigationUrl") or ""
+                        if "/in/" not in href:
+                            continue
+                        url = canonical_profile_url(href)
+                        if url not in seen:
+                            profiles.append({"profile_url": url})
+                            seen.add(url)
+                            added += 1
+                if not added:
+                    break
+                start += VOYAGER_PAGE_SIZE
+    except (httpx.HTTPError, ValueError) as e:
+        logger.warning("Voyager search API failed after %d profiles: %s", len(profiles), e)
+
+    logger.info("Collected %d profile candidates from Voyager search API", len(profiles))
+    return profiles[:max_profiles]
+
+
+def more_results_loaded(prev_count: int, prev_height: int):
+    """WebDriverWait predicate: true once more result items render, the page grows,
+    or there is still unscrolled content below the viewport."""
+    def _loaded(d):
+        # counted in the page: one round-trip per poll instead of serializing every result element
+        return d.execute_script(
+            "return document.querySelectorAll(arguments[0] + ' > li').length > arguments[1]"
+            " || document.body.scrollHeight > arguments[2]"
+            " || window.scrollY + window.innerHeight < document.body.scrollHeight;",
+            SEARCH_RESULTS_UL_CSS, prev_count, prev_height,
+        )
+    return _loaded
+
+
 def search_and_collect_profiles(driver, query: str, max_profiles: int = MAX_PROFILES_DEFAULT, timeout=15) -> List[Dict[str, Any]]:
     """Use driver to perform the search and collect profile URLs (up to max_profiles)."""
     wait = WebDriverWait(driver, timeout)
@@ -198,48 +498,60 @@ def search_and_collect_profiles(driver, query: str, max_profiles: int = MAX_PROF
 
     profiles = []
     seen = set()
-    last_height = driver.execute_script("return document.body.scrollHeight")
     scroll_tries = 0
+    scroll_wait = SCROLL_WAIT_MIN
 
-    while len(profiles) < max_profiles and scroll_tries < 30:
-        lis = driver.find_elements(By.CSS_SELECTOR, f"{SEARCH_RESULTS_UL_CSS} > li")
-        for li in lis:
+    while len(profiles) < max_profiles and scroll_tries < MAX_SCROLL_TRIES:
+        # one WebDriver round-trip: read result hrefs, scroll to load more, report list size + page height
+        hrefs, count, height = driver.execute_script(
+            COLLECT_AND_SCROLL_JS, SEARCH_RESULTS_UL_CSS, SEARCH_RESULT_LINK_CSS
+        )
+        for href in hrefs:
             if len(profiles) >= max_profiles:
                 break
-            try:
-                a = li.find_element(By.CSS_SELECTOR, "a.yRgCVsjrzAHkdCEjqvAcmnsmCUhbwIZbY")
-                href = a.get_attribute("href")
-                if href and href not in seen:
-                    profiles.append({"profile_url": href})
-                    seen.add(href)
-            except Exception:
-                try:
-                    a2 = li.find_element(By.TAG_NAME, "a")
-                    href = a2.get_attribute("href")
-                    if href and href not in seen:
-                        profiles.append({"profile_url": href})
-                        seen.add(href)
-                except Exception:
-                    continue
-
-        # scroll to load more
-        driver.execute_script("window.scrollBy(0, window.innerHeight);")
-        time.sleep(1 + random.random() * 0.5)
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
-            scroll_tries += 1
-        else:
-            last_height = new_height
+            if not href:
+                continue
+            url = canonical_profile_url(href)
+            if url not in seen:
+                profiles.append({"profile_url": url})
+                seen.add(url)
+        if len(profiles) >= max_profiles:
+            break
+
+        # wait only as long as the new results take to render
+        try:
+            WebDriverWait(driver, scroll_wait).until(more_results_loaded(count, height))
             scroll_tries = 0
+            scroll_wait = SCROLL_WAIT_MIN
+        except TimeoutException:
+            scroll_tries += 1
+            scroll_wait = min(2 * scroll_wait, SCROLL_WAIT_MAX)
 
     logger.info("Collected %d profile candidates from search", len(profiles))
     return profiles[:max_profiles]
 
 
-def detect_resume_worker(profile: Dict[str, Any], headless=True, timeout=12) -> Dict[str, Any]:
+def create_http_client(cookies: Dict[str, str], timeout=12) -> httpx.AsyncClient:
+    """Create an async HTTP client that shares the browser's LinkedIn session."""
+    return httpx.AsyncClient(
+        cookies=cookies,
+        headers={
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        },
+        http2=True,
+        follow_redirects=True,
+        timeout=timeout,
+        # keep one pooled connection per concurrent fetch (httpx keeps only 20 alive by default)
+        limits=httpx.Limits(max_connections=PROFILE_CONCURRENCY, max_keepalive_connections=PROFILE_CONCURRENCY),
+    )
+
+
+async def check_profile(profile: Dict[str, Any], client: httpx.AsyncClient, sem: asyncio.Semaphore) -> Dict[str, Any]:
     """
-    Worker that creates its own driver, logs in, fetches the profile page and heuristically checks for resumes.
-    Returns dict with name, profile_url, resume_found, resume_links, error (optional).
+    Fetch the profile page over HTTP with the shared session and heuristically check it for resumes.
+    Returns dict with profile_url, resume_found, resume_links, error (optional).
     """
     result = {
         "profile_url": profile.get("profile_url"),
@@ -247,105 +559,179 @@ def detect_resume_worker(profile: Dict[str, Any], headless=True, timeout=12) ->
         "resume_links": [],
         "error": None,
     }
-    driver = None
-    try:
-        driver = create_driver(headless=headless)
-        login_linkedin(driver, timeout=15)
-        # tiny randomized delay
-        time.sleep(0.7 + random.random() * 0.8)
-        driver.get(profile["profile_url"])
-        # let JS load
-        time.sleep(1.5 + random.random() * 1.0)
-        page_html = driver.page_source
-        if RESUME_REGEX.search(page_html):
-            # find anchors with file links or containing 'resume'/'cv'
-            anchors = driver.find_elements(By.TAG_NAME, "a")
-            links = []
-            for a in anchors:
-                try:
-                    href = a.get_attribute("href") or ""
-                    if re.search(r"\.pdf|\.docx|\.doc", href, re.IGNORECASE) or re.search(r"resume|cv", href, re.IGNORECASE):
-                        links.append(href)
-                except Exception:
-                    continue
-            # dedupe
-            links = list(dict.fromkeys(links))
-            result["resume_found"] = True
-            result["resume_links"] = links
-        # small polite delay before quitting
-        time.sleep(0.2 + random.random() * 0.4)
-    except Exception as e:
-        logger.exception("Worker error for profile %s: %s", profile.get("profile_url"), str(e))
-        result["error"] = str(e)
-    finally:
+    async with sem:
         try:
-            if driver:
-                driver.quit()
-        except Exception:
-            pass
+            # tiny randomized delay
+            await asyncio.sleep(0.2 + random.random() * 0.4)
+            page_html = None
+            async with client.stream("GET", profile["profile_url"]) as response:
+                # gate on status / redirect target / size from the headers, before downloading the body
+                content_length = int(response.headers.get("content-length") or 0)
+                if response.status_code != 200 or is_unreachable_path(response.url.path):
+                    result["error"] = "unreachable (HTTP %d at %s)" % (response.status_code, response.url)
+                elif content_length > MAX_PROFILE_BYTES:
+                    result["error"] = "unreachable (page too large: %d bytes)" % content_length
+                else:
+                    # Content-Length is usually absent (chunked) or the compressed size, so cap what we read
+                    chunks = []
+                    size = 0
+                    async for chunk in response.aiter_bytes():
+                        size += len(chunk)
+                        if size > MAX_PROFILE_BYTES:
+                            result["error"] = "unreachable (page larger than %d bytes)" % MAX_PROFILE_BYTES
+                            break
+                        chunks.append(chunk)
+                    else:
+                        page_html = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+            if page_html is None:
+                logger.warning("Skipping profile %s: %s", result["profile_url"], result["error"])
+            else:
+                # cheap substring check first (page lowercased once); the regex only runs on pages that can contain resume links
+                lowered = page_html.lower()
+                if any(keyword in lowered for keyword in RESUME_KEYWORDS):
+                    # find anchors with file links or containing 'resume'/'cv' (deduped, order kept)
+                    base_url = str(response.url)
+                    links = list(dict.fromkeys(
+                        urljoin(base_url, html.unescape(href)) for href in ANCHOR_REGEX.findall(page_html)
+                    ))
+                    result["resume_found"] = True
+                    result["resume_links"] = links
+        except Exception as e:
+            logger.exception("Worker error for profile %s: %s", profile.get("profile_url"), str(e))
+            result["error"] = str(e)
+    logger.info("Checked profile: %s resume_found=%s", result["profile_url"], result["resume_found"])
     return result
 
 
-@app.post("/search")
-def search_endpoint(req: SearchRequest):
+async def check_profiles(
+    profiles: List[Dict[str, Any]],
+    cookies: Dict[str, str],
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Check all profiles concurrently over one pooled HTTP/2 client.
+
+    on_result (optional) is called with each result as soon as it completes.
     """
-    POST /search
-    Body: { "query": "Software Engineer", "max_profiles": 20 }
-    Returns: JSON with path to CSV and summary.
-    This endpoint performs the whole flow synchronously and returns after completion.
+    sem = asyncio.Semaphore(PROFILE_CONCURRENCY)
+    results = []
+    async with create_http_client(cookies) as client:
+        for future in asyncio.as_completed([check_profile(p, client, sem) for p in profiles]):
+            res = await future
+            results.append(res)
+            if on_result:
+                on_result(res)
+    return results
+
+
+def collect_profiles(query: str, max_profiles: int) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """Blocking login + search stage.
+
+    Returns (profiles, session cookies). Any browser used here goes back to the idle cache
+    before returning, so none is held by this job during the profile-check stage.
     """
-    query = req.query.strip()
-    max_profiles = req.max_profiles or MAX_PROFILES_DEFAULT
-    logger.info("Received search request: query=%s max_profiles=%d", query, max_profiles)
-
     driver = None
     try:
-        driver = create_driver(headless=HEADLESS)
-        logger.info("Primary driver created, logging in for search...")
-        login_linkedin(driver)
+        saved_cookies = load_session()
+        if saved_cookies and session_is_valid(saved_cookies):
+            logger.info("Reusing saved LinkedIn session from %s", SESSION_PATH)
+        else:
+            logger.info("No valid saved session, acquiring primary driver and logging in...")
+            driver = acquire_driver(headless=HEADLESS)
+            saved_cookies = driver.get_cookies()
+            save_session(saved_cookies)
         logger.info("Logged in. Starting search for query: %s", query)
-        profiles = search_and_collect_profiles(driver, query, max_profiles=max_profiles)
+        cookies = session_cookies(saved_cookies)
+        profiles = search_profiles_api(cookies, query, max_profiles=max_profiles)
         if not profiles:
-            raise HTTPException(status_code=404, detail="No profiles found for the given query")
-
-        # Use ThreadPoolExecutor to check profiles in parallel
-        results = []
-        found_count = 0
-        logger.info("Starting ThreadPoolExecutor with max_workers=%d", MAX_WORKERS)
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            future_to_profile = {executor.submit(detect_resume_worker, p, HEADLESS): p for p in profiles}
-            for future in as_completed(future_to_profile):
-                res = future.result()
-                results.append(res)
-                if res.get("resume_found"):
-                    found_count += 1
-                logger.info("Checked profile: %s resume_found=%s", res.get("profile_url"), res.get("resume_found"))
+            logger.info("Voyager search returned nothing; falling back to scrolling search results.")
+            if driver is None:
+                driver = acquire_driver(headless=HEADLESS, cookies=saved_cookies)
+            profiles = search_and_collect_profiles(driver, query, max_profiles=max_profiles)
+            # the driver may have logged in again (restored cookies rejected); use its current session
+            cookies = session_cookies(driver.get_cookies())
+        return profiles, cookies
+    finally:
+        if driver:
+            release_driver(driver)
+
+
+async def run_scrape(job_id: str, query: str, max_profiles: int) -> None:
+    """
+    Background job: collect profiles, check them and stream results to CSV.
+    Progress and the final summary are recorded in JOBS[job_id].
+    """
+    job = JOBS[job_id]
+    try:
+        profiles, cookies = await run_in_threadpool(collect_profiles, query, max_profiles)
+        if not profiles:
+            raise RuntimeError("No profiles found for the given query")
 
-        # Save results to CSV
         timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-        csv_filename = f"results_{query.replace(' ', '_')}_{timestamp}.csv"
+        # job_id keeps concurrent jobs for the same query (same second) from sharing a file
+        csv_filename = f"results_{query.replace(' ', '_')}_{timestamp}_{job_id[:8]}.csv"
         csv_path = os.path.join(OUTPUT_DIR, csv_filename)
-        df = pd.DataFrame(results)
-        df.to_csv(csv_path, index=False)
-        logger.info("Saved CSV to %s (found %d profiles with resume heuristics)", csv_path, found_count)
-
-        return {
-            "status": "completed",
-            "query": query,
-            "profiles_checked": len(results),
-            "resumes_found": found_count,
-            "csv_path": csv_path,
-            "results_preview": results[:10],  # small preview in response
-        }
-    except HTTPException as he:
-        logger.error("HTTP error: %s", he.detail)
-        raise he
+        job.update(csv_path=csv_path, profiles_total=len(profiles))
+
+        # Reuse the login session for HTTP profile checks, streaming each result to CSV as it completes
+        logger.info("Job %s: checking %d profiles over HTTP with concurrency=%d", job_id, len(profiles), PROFILE_CONCURRENCY)
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+
+            def write_result(res: Dict[str, Any]) -> None:
+                writer.writerow({**res, "resume_links": ";".join(res["resume_links"])})
+                f.flush()
+                job["profiles_checked"] += 1
+                if res.get("resume_found"):
+                    job["resumes_found"] += 1
+
+            results = await check_profiles(profiles, cookies, on_result=write_result)
+        logger.info("Job %s: saved CSV to %s (found %d profiles with resume heuristics)", job_id, csv_path, job["resumes_found"])
+
+        job.update(status="completed", results_preview=results[:10])  # small preview in response
     except Exception as e:
-        logger.exception("Fatal error while processing search")
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+        logger.exception("Job %s: fatal error while processing search", job_id)
+        job.update(status="failed", error=str(e))
+
+
+@app.post("/search", status_code=202)
+async def search_endpoint(req: SearchRequest, background_tasks: BackgroundTasks):
+    """
+    POST /search
+    Body: { "query": "Software Engineer", "max_profiles": 20 }
+    Returns: JSON with the job_id to poll via GET /search/{job_id}.
+    The scrape runs as a background task after the response is sent.
+    """
+    query = req.query.strip()
+    max_profiles = req.max_profiles or MAX_PROFILES_DEFAULT
+    job_id = uuid.uuid4().hex
+    logger.info("Received search request: job_id=%s query=%s max_profiles=%d", job_id, query, max_profiles)
+
+    JOBS[job_id] = {
+        "job_id": job_id,
+        "status": "running",
+        "query": query,
+        "max_profiles": max_profiles,
+        "created_at": datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
+        "profiles_total": None,
+        "profiles_checked": 0,
+        "resumes_found": 0,
+        "csv_path": None,
+        "results_preview": [],
+        "error": None,
+    }
+    background_tasks.add_task(run_scrape, job_id, query, max_profiles)
+    return {"job_id": job_id, "status": "running", "query": query}
+
+
+@app.get("/search/{job_id}")
+async def search_status_endpoint(job_id: str):
+    """
+    GET /search/{job_id}
+    Returns: the job's status ("running", "completed" or "failed"), progress counters,
+    csv_path (results are written incrementally) and a results preview once completed.
+    """
+    job = JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job_id")
+    return job